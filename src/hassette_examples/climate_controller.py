@@ -15,6 +15,7 @@ from typing import Annotated
 from pydantic_settings import SettingsConfigDict
 
 from hassette import A, App, AppConfig, C, D, states
+from hassette.state_manager import DomainStates
 
 
 class ClimateControllerConfig(AppConfig):
@@ -29,6 +30,14 @@ class ClimateControllerConfig(AppConfig):
 class ClimateController(App[ClimateControllerConfig]):
     """React to temperature changes and control an AC switch."""
 
+    _sensor_states: DomainStates[states.SensorState]
+    _climate_states: DomainStates[states.ClimateState]
+    _switch_states: DomainStates[states.SwitchState]
+
+    _temp_threshold: float
+    _ac_switch: str
+    _climate_entity: str
+
     async def on_initialize(self) -> None:
         cfg = self.app_config
         self.logger.info(
@@ -37,6 +46,18 @@ class ClimateController(App[ClimateControllerConfig]):
             cfg.ac_switch,
         )
 
+        # Copy the config values the handlers read onto the app itself
+        self._temp_threshold = float(cfg.temp_threshold)
+        self._ac_switch = cfg.ac_switch
+        self._climate_entity = cfg.climate_entity
+
+        # Domain accessors are stable for the app's lifetime, so resolve them once
+        # instead of on every summary tick. The states themselves are snapshots and
+        # are still looked up each time.
+        self._sensor_states = self.states.sensor
+        self._climate_states = self.states.climate
+        self._switch_states = self.states.switch
+
         # Watch all temperature sensors via glob pattern
         self.bus.on_state_change(
             "sensor.*temperature*",
@@ -82,9 +103,9 @@ class ClimateController(App[ClimateControllerConfig]):
         except (ValueError, TypeError):
             temp = None
 
-        if temp is not None and temp > self.app_config.temp_threshold:
+        if temp is not None and temp > self._temp_threshold and not self._ac_is("on"):
             self.logger.info("Temperature %.1f° exceeds threshold, turning on AC", temp)
-            await self.api.turn_on(self.app_config.ac_switch)
+            await self.api.turn_on(self._ac_switch)
 
     async def on_temp_decreased(
         self,
@@ -106,9 +127,9 @@ class ClimateController(App[ClimateControllerConfig]):
         except (ValueError, TypeError):
             temp = None
 
-        if temp is not None and temp <= self.app_config.temp_threshold:
+        if temp is not None and temp <= self._temp_threshold and not self._ac_is("off"):
             self.logger.info("Temperature %.1f° below threshold, turning off AC", temp)
-            await self.api.turn_off(self.app_config.ac_switch)
+            await self.api.turn_off(self._ac_switch)
 
     async def on_hvac_temp_change(
         self,
@@ -117,15 +138,20 @@ class ClimateController(App[ClimateControllerConfig]):
         """HVAC current_temperature attribute changed."""
         self.logger.info("HVAC current temperature is now: %s", current_temp)
 
-        if current_temp is not None and current_temp > self.app_config.temp_threshold:
+        if current_temp is not None and current_temp > self._temp_threshold and not self._ac_is("on"):
             self.logger.info("HVAC reports %.1f° — ensuring AC is on", current_temp)
-            await self.api.turn_on(self.app_config.ac_switch)
+            await self.api.turn_on(self._ac_switch)
+
+    def _ac_is(self, value: str) -> bool:
+        """Return True if the AC switch is currently in the given state."""
+        ac = self._switch_states.get(self._ac_switch)
+        return ac is not None and ac.value == value
 
     async def log_climate_summary(self) -> None:
         """Periodic summary of climate-related entities."""
-        outside = self.states.sensor.get("sensor.outside_temperature")
-        hvac = self.states.climate.get(self.app_config.climate_entity)
-        ac = self.states.switch.get(self.app_config.ac_switch)
+        outside = self._sensor_states.get("sensor.outside_temperature")
+        hvac = self._climate_states.get(self._climate_entity)
+        ac = self._switch_states.get(self._ac_switch)
 
         self.logger.info(
             "Climate summary — outside=%s, hvac=%s (current=%s), ac=%s",
@@ -2,7 +2,8 @@
 
 Automates cover/blind positions on a daily schedule. Opens covers on
 weekday mornings, closes them at night, and logs positions hourly.
-Uses the cache to persist last-known positions across restarts.
+Tracks positions from cover events and uses the cache to persist them
+across restarts, flushing only when something has changed.
 
 Demo entities:
     - cover.kitchen_window
@@ -11,6 +12,8 @@ Demo entities:
     - sun.sun
 """
 
+import logging
+
 from hassette import App, AppConfig, RawStateChangeEvent
 
 CACHE_KEY_POSITIONS = "last_cover_positions"
@@ -21,20 +24,31 @@ class CoverSchedulerConfig(AppConfig):
     morning_open_minute: int = 30
     night_close_hour: int = 22
     night_close_minute: int = 0
+    position_flush_interval: float = 5.0  # seconds
 
 
 class CoverScheduler(App[CoverSchedulerConfig]):
     """Schedule cover open/close and track positions."""
 
+    _cover_ids: list[str]
+    _positions: dict[str, str | None]
+    _positions_dirty: bool = False
+
     async def on_initialize(self) -> None:
         cfg = self.app_config
         self.logger.info("Cover scheduler started")
 
+        # Snapshot the cover entity IDs once; on_cover_change keeps the list current
+        self._cover_ids = self.states.cover.keys()
+
         # Restore cached positions
         cached = self.cache.get(CACHE_KEY_POSITIONS)
         if cached:
             self.logger.info("Restored cached cover positions: %s", cached)
 
+        # Seed positions from current state; on_cover_change keeps them up to date
+        self._positions = await self._get_cover_positions()
+
         # Open covers on weekday mornings (Mon-Fri, cron day_of_week 1-5)
         self.scheduler.run_cron(
             self.open_all_covers,
@@ -54,6 +68,9 @@ class CoverScheduler(App[CoverSchedulerConfig]):
         # Log cover positions every hour
         self.scheduler.run_hourly(self.log_cover_positions, name="position_log")
 
+        # Write changed positions to the cache in batches rather than per event
+        self.scheduler.run_every(self.flush_positions, cfg.position_flush_interval, name="position_flush")
+
         # One-time sun state report 10 seconds after startup
         self.scheduler.run_in(self.report_sun_state, 10, name="startup_sun_report")
 
@@ -65,35 +82,30 @@ class CoverScheduler(App[CoverSchedulerConfig]):
 
     async def on_shutdown(self) -> None:
         """Persist cover positions to cache before stopping."""
-        positions = await self._get_cover_positions()
-        self.cache[CACHE_KEY_POSITIONS] = positions
-        self.logger.info("Saved cover positions to cache: %s", positions)
+        self.cache[CACHE_KEY_POSITIONS] = dict(self._positions)
+        self._positions_dirty = False
+        self.logger.info("Saved cover positions to cache: %s", self._positions)
 
     async def open_all_covers(self) -> None:
         """Open all covers."""
         self.logger.info("Opening all covers (weekday morning schedule)")
-        for entity_id, cover in self.states.cover:
-            self.logger.info("Opening %s (current state: %s)", entity_id, cover.value)
-            try:
-                await self.api.call_service("cover", "open_cover", target={"entity_id": entity_id})
-            except Exception:
-                self.logger.exception("Failed to open %s", entity_id)
+        await self._call_cover_service("open_cover", "Opening")
 
     async def close_all_covers(self) -> None:
         """Close all covers."""
         self.logger.info("Closing all covers (nightly schedule)")
-        for entity_id, cover in self.states.cover:
-            self.logger.info("Closing %s (current state: %s)", entity_id, cover.value)
-            try:
-                await self.api.call_service("cover", "close_cover", target={"entity_id": entity_id})
-            except Exception:
-                self.logger.exception("Failed to close %s", entity_id)
+        await self._call_cover_service("close_cover", "Closing")
 
     async def log_cover_positions(self) -> None:
         """Hourly position log."""
-        positions = await self._get_cover_positions()
-        self.logger.info("Hourly cover positions: %s", positions)
-        self.cache[CACHE_KEY_POSITIONS] = positions
+        self.logger.info("Hourly cover positions: %s", self._positions)
+
+    async def flush_positions(self) -> None:
+        """Write tracked positions to the cache if any changed since the last flush."""
+        if not self._positions_dirty:
+            return
+        self.cache[CACHE_KEY_POSITIONS] = dict(self._positions)
+        self._positions_dirty = False
 
     async def report_sun_state(self) -> None:
         """One-time startup report of sun state."""
@@ -112,21 +124,55 @@ class CoverScheduler(App[CoverSchedulerConfig]):
     async def on_cover_change(self, event: RawStateChangeEvent) -> None:
         """Any cover changed state."""
         data = event.payload.data
-        self.logger.info(
-            "Cover %s changed: %s -> %s",
-            data.entity_id,
-            data.old_state_value,
-            data.new_state_value,
-        )
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "Cover %s changed: %s -> %s",
+                data.entity_id,
+                data.old_state_value,
+                data.new_state_value,
+            )
+
+        # Track covers appearing in or disappearing from Home Assistant
+        if data.new_state is None:
+            if data.entity_id in self._cover_ids:
+                self._cover_ids.remove(data.entity_id)
+            self._positions.pop(data.entity_id, None)
+        else:
+            if data.entity_id not in self._cover_ids:
+                self._cover_ids.append(data.entity_id)
+            self._positions[data.entity_id] = data.new_state["state"]
+        self._positions_dirty = True
 
     async def on_sun_first_change(self, event: RawStateChangeEvent) -> None:
         """Fires once when the sun entity first changes."""
         data = event.payload.data
         self.logger.info("Sun transitioned: %s -> %s", data.old_state_value, data.new_state_value)
 
+    async def _call_cover_service(self, service: str, action: str) -> None:
+        """Call a cover service once, targeting every known cover."""
+        covers = self.states.cover
+        entity_ids: list[str] = []
+        for entity_id in self._cover_ids:
+            cover = covers.get(entity_id)
+            if cover is None:
+                continue
+            self.logger.info("%s %s (current state: %s)", action, entity_id, cover.value)
+            entity_ids.append(entity_id)
+
+        if not entity_ids:
+            return
+
+        try:
+            await self.api.call_service("cover", service, target={"entity_id": entity_ids})
+        except Exception:
+            self.logger.exception("Failed to call cover.%s for %s", service, ", ".join(entity_ids))
+
     async def _get_cover_positions(self) -> dict[str, str | None]:
         """Collect current cover positions."""
         positions: dict[str, str | None] = {}
-        for entity_id, cover in self.states.cover:
-            positions[entity_id] = cover.value
+        covers = self.states.cover
+        for entity_id in self._cover_ids:
+            cover = covers.get(entity_id)
+            if cover is not None:
+                positions[entity_id] = cover.value
         return positions
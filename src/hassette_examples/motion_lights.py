@@ -10,6 +10,8 @@ Demo entities:
     - light.ceiling_lights
 """
 
+import logging
+
 from pydantic_settings import SettingsConfigDict
 
 from hassette import App, AppConfig, entities
@@ -28,6 +30,8 @@ class MotionLightsConfig(AppConfig):
 class MotionLights(App[MotionLightsConfig]):
     """Turn a light on when motion is detected, off when it clears."""
 
+    _light: entities.LightEntity | None = None
+
     async def on_initialize(self) -> None:
         cfg = self.app_config
         self.logger.info(
@@ -62,13 +66,19 @@ class MotionLights(App[MotionLightsConfig]):
         cfg = self.app_config
         self.logger.info("Motion detected on %s", cfg.motion_entity)
 
-        light = await self.api.get_entity(cfg.light_entity, entities.LightEntity)
+        # Resolve the light entity on first use; later motion events reuse it
+        light = self._light
+        if light is None:
+            light = self._light = await self.api.get_entity(cfg.light_entity, entities.LightEntity)
         await light.turn_on(brightness=cfg.boost_brightness)
         self.logger.info("Turned on %s at brightness %d", cfg.light_entity, cfg.boost_brightness)
 
-        # Refresh and log the updated state
-        updated = await light.refresh()
-        self.logger.debug("Light state after turn_on: %s (brightness=%s)", updated.value, updated.attributes.brightness)
+        # Refresh and log the updated state — only worth the round-trip when debugging
+        if self.logger.isEnabledFor(logging.DEBUG):
+            updated = await light.refresh()
+            self.logger.debug(
+                "Light state after turn_on: %s (brightness=%s)", updated.value, updated.attributes.brightness
+            )
 
     async def on_motion_cleared(self) -> None:
         """Motion cleared — dim down or turn off."""
@@ -12,10 +12,14 @@ Demo entities:
     - zone.home
 """
 
+import asyncio
+import logging
+
 from pydantic_settings import SettingsConfigDict
 
 from hassette import App, AppConfig, C, D, RawStateChangeEvent, states
 from hassette.bus.listeners import Subscription
+from hassette.state_manager import DomainStates
 
 
 class PresenceTrackerConfig(AppConfig):
@@ -30,11 +34,19 @@ class PresenceTracker(App[PresenceTrackerConfig]):
     """Track a person's presence and dynamically manage zone subscriptions."""
 
     _zone_subscription: Subscription | None = None
+    _tracker_states: DomainStates[states.DeviceTrackerState]
+    _presence_entity: str
+    _presence_attributes: dict[str, str]
+    _pending_presence: str | None = None
+    _presence_write: asyncio.Task[None] | None = None
 
     async def on_initialize(self) -> None:
         cfg = self.app_config
         self.logger.info("Tracking presence for %s via %s", cfg.person_name, cfg.tracker_entity)
 
+        # Resolve the domain accessor once; log_status reads through it every tick
+        self._tracker_states = self.states.device_tracker
+
         # Watch for tracker state changes
         self.bus.on_state_change(
             cfg.tracker_entity,
@@ -44,20 +56,23 @@ class PresenceTracker(App[PresenceTrackerConfig]):
         # Periodic status log
         self.scheduler.run_every(self.log_status, cfg.status_interval, name=f"{cfg.person_name}_status")
 
-        # Create a custom presence sensor
-        tracker_state = self.states.device_tracker.get(cfg.tracker_entity)
+        # Create a custom presence sensor; its ID and attributes never change
+        self._presence_entity = f"sensor.{cfg.person_name.lower()}_presence"
+        self._presence_attributes = {"friendly_name": f"{cfg.person_name} Presence", "source": cfg.tracker_entity}
+        tracker_state = self._tracker_states.get(cfg.tracker_entity)
         initial_status = "home" if tracker_state and tracker_state.value == "home" else "away"
-        await self.api.set_state(
-            f"sensor.{cfg.person_name.lower()}_presence",
-            initial_status,
-            attributes={"friendly_name": f"{cfg.person_name} Presence", "source": cfg.tracker_entity},
-        )
-        self.logger.info("Created sensor.%s_presence = %s", cfg.person_name.lower(), initial_status)
+        self._publish_presence(initial_status)
+        self.logger.info("Creating %s = %s", self._presence_entity, initial_status)
 
         # If person is already away, subscribe to zone changes
         if initial_status == "away":
             self._subscribe_to_zone()
 
+    async def on_shutdown(self) -> None:
+        """Let the last presence write finish before the task bucket is cancelled."""
+        if self._presence_write is not None:
+            await self._presence_write
+
     async def on_tracker_change(
         self,
         new_state: D.StateNew[states.DeviceTrackerState],
@@ -65,16 +80,13 @@ class PresenceTracker(App[PresenceTrackerConfig]):
     ) -> None:
         """Device tracker state changed."""
         cfg = self.app_config
-        old_val = old_state.value if old_state else None
-        self.logger.info("%s tracker changed: %s -> %s", cfg.person_name, old_val, new_state.value)
+        if self.logger.isEnabledFor(logging.INFO):
+            old_val = old_state.value if old_state else None
+            self.logger.info("%s tracker changed: %s -> %s", cfg.person_name, old_val, new_state.value)
 
         # Update custom sensor
         status = "home" if new_state.value == "home" else "away"
-        await self.api.set_state(
-            f"sensor.{cfg.person_name.lower()}_presence",
-            status,
-            attributes={"friendly_name": f"{cfg.person_name} Presence", "source": cfg.tracker_entity},
-        )
+        self._publish_presence(status)
 
         if new_state.value != "home" and self._zone_subscription is None:
             # Person left home — subscribe to zone changes
@@ -86,6 +98,31 @@ class PresenceTracker(App[PresenceTrackerConfig]):
             self._zone_subscription.cancel()
             self._zone_subscription = None
 
+    def _publish_presence(self, status: str) -> None:
+        """Write the custom presence sensor in the background.
+
+        The handler returns without waiting on Home Assistant. A single writer
+        task sends statuses one at a time; if several arrive while a write is in
+        flight, only the latest is sent next, so the sensor always ends on the
+        most recent status.
+        """
+        self._pending_presence = status
+        if self._presence_write is None or self._presence_write.done():
+            self._presence_write = self.task_bucket.spawn(
+                self._write_presence(),
+                name=f"{self._presence_entity}_update",
+            )
+
+    async def _write_presence(self) -> None:
+        """Drain pending presence statuses, writing each one in order."""
+        while self._pending_presence is not None:
+            status = self._pending_presence
+            self._pending_presence = None
+            try:
+                await self.api.set_state(self._presence_entity, status, attributes=self._presence_attributes)
+            except Exception:
+                self.logger.exception("Failed to set %s = %s", self._presence_entity, status)
+
     def _subscribe_to_zone(self) -> None:
         """Dynamically subscribe to zone.home occupancy changes."""
         self._zone_subscription = self.bus.on_state_change(
@@ -110,7 +147,7 @@ class PresenceTracker(App[PresenceTrackerConfig]):
     async def log_status(self) -> None:
         """Periodic presence status log."""
         cfg = self.app_config
-        tracker = self.states.device_tracker.get(cfg.tracker_entity)
+        tracker = self._tracker_states.get(cfg.tracker_entity)
         if tracker:
             self.logger.info(
                 "%s status: %s (lat=%s, lon=%s)",
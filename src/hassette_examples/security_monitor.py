@@ -10,6 +10,8 @@ Demo entities:
     - binary_sensor.basement_floor_wet
 """
 
+import logging
+
 from hassette import AppConfig, AppSync
 from hassette.events import CallServiceEvent
 
@@ -21,6 +23,8 @@ class SecurityMonitorConfig(AppConfig):
 class SecurityMonitor(AppSync[SecurityMonitorConfig]):
     """Monitor locks and moisture sensors using synchronous patterns."""
 
+    _lock_ids: list[str]
+
     def on_initialize_sync(self) -> None:
         cfg = self.app_config
         self.logger.info("Security monitor started (moisture throttle=%.0fs)", cfg.moisture_throttle)
@@ -39,9 +43,11 @@ class SecurityMonitor(AppSync[SecurityMonitorConfig]):
             throttle=cfg.moisture_throttle,
         )
 
-        # Log current lock states
+        # Log current lock states and remember the lock IDs for moisture alerts
+        self._lock_ids = []
         for entity_id, lock_state in self.states.lock:
             self.logger.info("Lock %s is currently %s", entity_id, lock_state.value)
+            self._lock_ids.append(entity_id)
 
     def on_lock_service_called(self, event: CallServiceEvent) -> None:
         """A lock service was called (lock, unlock, etc.)."""
@@ -60,6 +66,12 @@ class SecurityMonitor(AppSync[SecurityMonitorConfig]):
         )
 
         # Log all current lock states for the security report
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         self.logger.info("Current lock states during moisture alert:")
-        for entity_id, lock_state in self.states.lock:
-            self.logger.info("  %s: %s", entity_id, lock_state.value)
+        locks = self.states.lock
+        for entity_id in self._lock_ids:
+            lock_state = locks.get(entity_id)
+            if lock_state is not None:
+                self.logger.info("  %s: %s", entity_id, lock_state.value)